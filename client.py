@@ -1,13 +1,16 @@
-from PySide6.QtCore import Qt, QRectF, QPointF
+from operator import attrgetter
+
+from PySide6.QtCore import Qt, QRectF, QPointF, Signal
 from PySide6.QtGui import QBrush, QColor
-from PySide6.QtWidgets import QGraphicsObject
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsObject
 
 from request import Request
-from server import Server
-from request_queue import RequestQueue
 
 
 class Client(QGraphicsObject):
+    # Signal emitted when a request sent by this client is dropped
+    request_dropped = Signal()
+
     def __init__(self, x, y, priority=2, parent=None):
         """
         Constructs a Client with an optional parent item.
@@ -32,6 +35,9 @@ class Client(QGraphicsObject):
         self.setPos(x, y)
         self.setAcceptedMouseButtons(Qt.LeftButton)
 
+        # The shape never changes, so paint it once and reuse the cached image
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
     def boundingRect(self):
         """
         Defines the smallest rect enclosing the item; used for painting,
@@ -76,7 +82,7 @@ class Client(QGraphicsObject):
 
     def _create_request(self):
         """Create and position a new request in the scene."""
-        request = Request(priority=self.priority)
+        request = Request.acquire(priority=self.priority)
         offset = QPointF(
             self._rect.width() + 6,
             (self._rect.height() - request._rect.height()) / 2
@@ -85,54 +91,29 @@ class Client(QGraphicsObject):
         request.setPos(spawn_pos)
         self.scene().addItem(request)
 
-        # Connect to dropped signal if main window exists
-        if hasattr(self.scene().views()[0], 'window'):
-            main_window = self.scene().views()[0].window()
-            if hasattr(main_window, '_on_request_dropped'):
-                request.dropped.connect(main_window._on_request_dropped)
+        # Forward the request's dropped signal to whoever listens on this client
+        request.dropped.connect(self.request_dropped)
 
         return request
 
     def _route_request(self, request: Request):
         """Route a request to the appropriate destination."""
-        target_queue = self._find_target_queue()
-
-        if not target_queue:
-            # No queues available, try to send directly to server
-            server = self._find_server()
-            if server:
-                request.move_to_server(server)
-            return
-
-        # Route based on queue state
-        if target_queue.can_bypass:
-            request.move_to_server(target_queue.paired_server)
-        else:
-            request.move_to_queue(target_queue)
-
-    def _find_target_queue(self):
-        """
-        Find the best queue to send a request to.
-
-        Returns:
-            RequestQueue or None
-        """
         scene = self.scene()
-        queues = [item for item in scene.items() if isinstance(item, RequestQueue)]
-
-        if not queues:
-            return None
 
-        # First priority: find a bypassable queue
-        bypassable_queue = next((q for q in queues if q.can_bypass), None)
+        # First priority: go straight to the server of a bypassable queue
+        bypassable_queue = next(iter(scene.bypass_queues), None)
         if bypassable_queue:
-            return bypassable_queue
+            request.move_to_server(bypassable_queue.paired_server)
+            return
 
-        # Second priority: find the least busy queue
-        least_busy_queue = min(queues, key=lambda q: len(q.queue))
-        return least_busy_queue
+        queues = scene.queues
+        if not queues:
+            # No queues available, try to send directly to server
+            servers = scene.servers
+            if servers:
+                request.move_to_server(servers[0])
+            return
 
-    def _find_server(self):
-        """Find any server in the scene."""
-        scene = self.scene()
-        return next((item for item in scene.items() if isinstance(item, Server)), None)
+        # Second priority: the least busy queue
+        least_busy_queue = min(queues, key=attrgetter('_size'))
+        request.move_to_queue(least_busy_queue)
@@ -1,4 +1,5 @@
 import sys
+import time
 from PySide6.QtCore import Qt, QTimer, QElapsedTimer
 from PySide6.QtWidgets import (
     QApplication,
@@ -25,18 +26,15 @@ class MainWindow(QMainWindow):
         self._setup_ui()
 
     def _setup_timer(self):
-        """Set up the auto-send timer and updating stats timer."""
-        # Timer for auto-sending requests
+        """Set up the auto-send timer and the session timer for stats."""
+        # Single-shot timer for auto-sending requests, restarted after each send
         self.send_timer = QTimer()
-        self.send_timer.setInterval(10)
-        self.send_timer.timeout.connect(self._check_last_send_time)
+        self.send_timer.setSingleShot(True)
+        self.send_timer.timeout.connect(self._on_send_timeout)
         self.is_playing = False
-        self.last_send_timer = QElapsedTimer()
+        self._last_send_ns = 0
 
-        # Timer for updating stats display
-        self.stats_timer = QTimer()
-        self.stats_timer.setInterval(1000)
-        self.stats_timer.timeout.connect(self._update_stats_display)
+        # Session timer for the drop rate, which is refreshed as drops happen
         self.total_dropped = 0
         self.session_timer = QElapsedTimer()
 
@@ -49,6 +47,8 @@ class MainWindow(QMainWindow):
         layout.addLayout(self._create_control_buttons())
 
         self.view = View()
+        self.view.client.request_dropped.connect(self._on_request_dropped)
+        self.view.priority_client.request_dropped.connect(self._on_request_dropped)
         layout.addWidget(self.view)
 
         layout.addLayout(self._create_stats_display())
@@ -151,18 +151,18 @@ class MainWindow(QMainWindow):
         """Toggle auto-sending requests on/off."""
         if self.is_playing:
             self.send_timer.stop()
-            self.stats_timer.stop()
+            self._update_stats_display()
             self.play_btn.setText("Auto Send")
             self.is_playing = False
         else:
             self._auto_send_request()
-            self.last_send_timer.restart()
-            self.send_timer.start()
+            self._last_send_ns = time.monotonic_ns()
+            self.send_timer.start(self.interval_slider.value())
 
             self.total_dropped = 0
             self.total_dropped_label.setText("0")
+            self.dropped_rate_label.setText("0.00")
             self.session_timer.restart()
-            self.stats_timer.start()
 
             self.play_btn.setText("Stop")
             self.is_playing = True
@@ -171,12 +171,17 @@ class MainWindow(QMainWindow):
         """Update the timer interval and label display."""
         self.interval_label.setText(f"{value} ms/request")
 
-    def _check_last_send_time(self):
-        """Check if enough time has elapsed and send request."""
-        interval_ms = self.interval_slider.value()
-        if self.last_send_timer.elapsed() >= interval_ms:
-            self._auto_send_request()
-            self.last_send_timer.restart()
+        # Reschedule the pending send so the new interval applies right away
+        if self.is_playing:
+            elapsed_ms = (time.monotonic_ns() - self._last_send_ns) // 1_000_000
+            remaining_ms = max(0, value - elapsed_ms)
+            self.send_timer.start(remaining_ms)
+
+    def _on_send_timeout(self):
+        """Send a request and schedule the next one."""
+        self._auto_send_request()
+        self._last_send_ns = time.monotonic_ns()
+        self.send_timer.start(self.interval_slider.value())
 
     def _auto_send_request(self):
         """Automatically send a request from the client."""
@@ -188,6 +193,10 @@ class MainWindow(QMainWindow):
         self.total_dropped += 1
         self.total_dropped_label.setText(str(self.total_dropped))
 
+        # Refresh the drop rate every few drops rather than on a fixed timer
+        if self.is_playing and self.total_dropped % 5 == 0:
+            self._update_stats_display()
+
     def _update_stats_display(self):
         """Update the statistics display."""
         self.total_dropped_label.setText(str(self.total_dropped))
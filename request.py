@@ -11,7 +11,7 @@ from PySide6.QtCore import (
     Signal
 )
 from PySide6.QtGui import QBrush, QColor
-from PySide6.QtWidgets import QGraphicsObject
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsObject
 
 from server import Server
 from request_queue import RequestQueue
@@ -21,6 +21,17 @@ class Request(QGraphicsObject):
     # Signal emitted when request is dropped
     dropped = Signal()
 
+    # Phases of a request's trip; each one waits for the next position check
+    _PHASE_TO_QUEUE = 0
+    _PHASE_TO_SERVER = 1
+    _PHASE_ENTERING_SERVER = 2
+    _PHASE_DONE = 3
+
+    # Finished requests kept for reuse, so sending one doesn't construct a new
+    # graphics item with its timer and animations each time
+    _pool = []
+    _POOL_SIZE = 64
+
     def __init__(self, priority=2, parent=None):
         """
         Constructs a Request with an optional parent item.
@@ -31,35 +42,105 @@ class Request(QGraphicsObject):
         """
         super().__init__(parent)
 
+        self._rect = QRectF(0, 0, 80, 80)
+        self._reset(priority)
+
+        # Position checks are run by a single-shot timer at the times the move
+        # animation crosses them, rather than on every animation frame.
+        self._check_timer = QTimer(self)
+        self._check_timer.setSingleShot(True)
+        self._check_timer.timeout.connect(self._run_next_check)
+
+        self._setup_animations()
+
+        self.setAcceptedMouseButtons(Qt.NoButton)
+
+    @classmethod
+    def acquire(cls, priority=2):
+        """
+        Get a request from the pool of finished ones, or construct a new one.
+
+        Args:
+            priority: Priority level for requests sent by this client (1=high, 2=normal)
+
+        Returns:
+            A Request object that is not in any scene
+        """
+        if cls._pool:
+            request = cls._pool.pop()
+            request._reset(priority)
+            return request
+        return cls(priority=priority)
+
+    def _release(self):
+        """Return this request to the pool once it has left the scene."""
+        self._check_timer.stop()
+        for anim in (self._move_anim, self._processing_anim, self._bounce_anim, self._drop_anim):
+            anim.stop()
+        self.dropped.disconnect()
+
+        if len(self._pool) < self._POOL_SIZE:
+            self._pool.append(self)
+
+    def _reset(self, priority):
+        """
+        Set up the per-trip state, for a new request or one reused from the pool.
+
+        Args:
+            priority: Priority level for requests sent by this client (1=high, 2=normal)
+        """
         self.priority = priority
 
         # Visual properties
-        self._rect = QRectF(0, 0, 80, 80)
         if priority == 1:
             self._color = QColor(0, 114, 178)
         else:
             self._color = QColor(230, 159, 0)
         self._remaining_angle = 360
 
+        # Cache the rendered circle while the request only moves around; the
+        # cache is dropped once processing starts redrawing it every frame.
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
         # Target tracking
         self.target_server = None
         self.target_queue = None
+        self._accepted_into_queue = False
 
         # Animation state
-        self._move_anim = None
-        self._has_checked_queue = False
-        self._has_checked_server = False
-        self._has_entered_server = False
+        self._phase = self._PHASE_TO_QUEUE
+        self._pending_checks = []
 
-        self.setAcceptedMouseButtons(Qt.NoButton)
+    def _setup_animations(self):
+        """
+        Create the animations once so they can be reused for every move.
+
+        The animations are parented to the request, so they are destroyed along
+        with it and never need an explicit deleteLater().
+        """
+        # Movement between spawn position, queue slots and server
+        self._move_anim = QPropertyAnimation(self, b"pos", self)
+        self._move_anim.setEasingCurve(QEasingCurve.OutSine)
+        self._move_end_pos = QPointF()
 
-    def __lt__(self, other):
-        """Always return False so requests compare as equal (used by bisect)."""
-        return False
+        # Processing with clock-wise disappearing effect
+        self._processing_anim = QPropertyAnimation(self, b"remaining_angle", self)
+        self._processing_anim.setStartValue(360)
+        self._processing_anim.setEndValue(0)
+        self._processing_anim.setDuration(1000)
+        self._processing_anim.setEasingCurve(QEasingCurve.Linear)
+        self._processing_anim.finished.connect(self._on_processing_finished)
+
+        # Bounce back (horizontal movement)
+        self._bounce_anim = QPropertyAnimation(self, b"x", self)
+        self._bounce_anim.setDuration(500)
+        self._bounce_anim.setEasingCurve(QEasingCurve.OutCubic)
 
-    def __gt__(self, other):
-        """Always return False so requests compare as equal (used by bisect)."""
-        return False
+        # Drop down (vertical fall)
+        self._drop_anim = QPropertyAnimation(self, b"y", self)
+        self._drop_anim.setDuration(500)
+        self._drop_anim.setEasingCurve(QEasingCurve.InQuad)
+        self._drop_anim.finished.connect(self._on_drop_finished)
 
     def boundingRect(self):
         """
@@ -104,6 +185,7 @@ class Request(QGraphicsObject):
         self.target_server = server
 
         server.paired_queue.can_bypass = False
+        self.scene().bypass_queues.discard(server.paired_queue)
 
         server_center_x = server.scenePos().x() + server._rect.width() / 2
         end_x = server_center_x - self._rect.width() / 2
@@ -123,14 +205,8 @@ class Request(QGraphicsObject):
         self.target_queue = queue
 
         position = queue.accept_request(self)
-        if position <= queue.capacity:
-            slot_width = self._rect.width() + 10
-            self.end_x_in_queue = queue.scenePos().x() + slot_width * (5 - position) + 10
-        else:
-            self.end_x_in_queue = queue.scenePos().x() - self._rect.width() + 1
-
-        queue_center_y = queue.scenePos().y() + queue._rect.height() / 2
-        self.end_y_in_queue = queue_center_y - self._rect.height() / 2
+        self._accepted_into_queue = position <= queue.capacity
+        self.end_x_in_queue, self.end_y_in_queue = queue.slot_scene_pos(position)
 
         end_x = self.end_x_in_queue
         end_y = self.end_y_in_queue
@@ -152,98 +228,147 @@ class Request(QGraphicsObject):
 
     def _move_to(self, end_x, end_y, speed=1200):
         """
-        Create a movement animation with fixed speed.
+        Start the movement animation with fixed speed.
 
         Args:
             start_pos: QPointF starting position
             end_pos: QPointF ending position
             speed: pixels per second
         """
-        if self._move_anim:
-            self._move_anim = None
+        self._move_anim.stop()
 
         start_pos = self.pos()
-        end_pos = QPointF(end_x, end_y)
+        end_pos = self._move_end_pos
+        end_pos.setX(end_x)
+        end_pos.setY(end_y)
+
+        # Moves along the queue row are purely horizontal
+        dx = end_x - start_pos.x()
+        dy = end_y - start_pos.y()
+        if dy == 0:
+            distance = abs(dx)
+        elif dx == 0:
+            distance = abs(dy)
+        else:
+            distance = math.hypot(dx, dy)
 
-        dx = end_pos.x() - start_pos.x()
-        dy = end_pos.y() - start_pos.y()
-        distance = math.sqrt(dx * dx + dy * dy)
+        # Already in place: skip the animation and run any checks that are due
+        if distance < 1.0:
+            self.setPos(end_pos)
+            self._schedule_checks(end_x, end_x, 0)
+            return
 
         duration = int(distance / speed * 1000)
 
-        self._move_anim = QPropertyAnimation(self, b"pos")
         self._move_anim.setStartValue(start_pos)
         self._move_anim.setEndValue(end_pos)
         self._move_anim.setDuration(duration)
-        self._move_anim.setEasingCurve(QEasingCurve.OutSine)
 
-        self._move_anim.valueChanged.connect(self._check_position)
-        self._move_anim.finished.connect(self._move_anim.deleteLater)
         self._move_anim.start()
 
-    def _check_position(self):
-        """Check if request has reached key positions during animation."""
-        if self.target_queue and not self._has_checked_queue:
-            self._check_on_reach_queue()
-        elif self.target_server and not self._has_checked_server:
-            self._check_on_reach_server()
-        elif self.target_server and not self._has_entered_server:
-            self._check_on_enter_server()
+        self._schedule_checks(start_pos.x(), end_x, duration)
+
+    def _position_checks(self):
+        """
+        Collect the position checks that are still pending.
+
+        Returns:
+            A list of (threshold x, check method) pairs ordered by threshold, where
+            a check is due once the request's x position reaches its threshold.
+        """
+        width = self._rect.width()
+        checks = []
+
+        phase = self._phase
+
+        if self.target_queue and phase == self._PHASE_TO_QUEUE:
+            queue_left = self.target_queue.scenePos().x()
+            checks.append((queue_left - width, self._check_on_reach_queue))
+
+        if self.target_server:
+            server_left = self.target_server.scenePos().x()
+            if phase <= self._PHASE_TO_SERVER:
+                checks.append((server_left - width, self._check_on_reach_server))
+            if phase <= self._PHASE_ENTERING_SERVER:
+                server_center_x = server_left + self.target_server._rect.width() / 2
+                checks.append((server_center_x - width / 2, self._check_on_enter_server))
+
+        return checks
+
+    def _schedule_checks(self, start_x, end_x, duration):
+        """
+        Schedule the pending position checks crossed by the current move animation.
+
+        The OutSine easing curve maps elapsed time t to progress sin(t * pi / 2), so
+        the time at which a threshold is reached can be solved for directly.
+
+        Args:
+            start_x: Start x position of the animation
+            end_x: End x position of the animation
+            duration: Animation duration in milliseconds
+        """
+        self._pending_checks = []
+
+        for threshold_x, check in self._position_checks():
+            if start_x >= threshold_x:
+                time = 0
+            elif end_x >= threshold_x:
+                progress = (threshold_x - start_x) / (end_x - start_x)
+                time = duration * math.asin(progress) * 2 / math.pi
+            else:
+                # Thresholds are ordered, so none of the remaining ones are reached either
+                break
+            self._pending_checks.append((time, check))
+
+        if self._pending_checks:
+            self._check_timer.start(round(self._pending_checks[0][0]))
+        else:
+            self._check_timer.stop()
+
+    def _run_next_check(self):
+        """Run the next due position check and schedule the one after it."""
+        time, check = self._pending_checks.pop(0)
+        check()
+
+        # The check may have dropped the request, which clears the pending checks
+        if self._pending_checks:
+            next_time = self._pending_checks[0][0]
+            self._check_timer.start(round(next_time - time))
 
     def _check_on_reach_queue(self):
         """Check queue capacity and attempt to enter; drop request if queue is full."""
-        request_right = self.pos().x() + self._rect.width()
-        queue_left = self.target_queue.scenePos().x()
-
-        if request_right >= queue_left:
-            self._has_checked_queue = True
-            queue = self.target_queue
-
-            # Check if request was successfully added to queue at spawn time, which allows
-            # consistent animation speed from spawn position to the final queue slot.
-            # Note: The acceptance decision is made when move_to_queue() is called, not when
-            # the request visually reaches the queue. If the queue was full at spawn time,
-            # the request will be dropped here even if a slot opens up during travel.
-            is_in_queue = any(req is self for _, req in queue.queue)
-            if not is_in_queue:
-                self._drop(blocking_obj=queue)
+        self._phase = self._PHASE_TO_SERVER
+        queue = self.target_queue
+
+        # Check if request was successfully added to queue at spawn time, which allows
+        # consistent animation speed from spawn position to the final queue slot.
+        # Note: The acceptance decision is made when move_to_queue() is called, not when
+        # the request visually reaches the queue. If the queue was full at spawn time,
+        # the request will be dropped here even if a slot opens up during travel.
+        if not self._accepted_into_queue:
+            self._drop(blocking_obj=queue)
 
     def _check_on_reach_server(self):
         """Check server avalibility and attempt to enter; drop request if server is busy."""
-        request_right = self.pos().x() + self._rect.width()
-        server_left = self.target_server.scenePos().x()
-
-        if request_right >= server_left:
-            self._has_checked_server = True
-            server = self.target_server
-            if server.current_request is None:
-                server.accept_request(self)
-            elif server.current_request and server.current_request is not self:
-                self._drop(blocking_obj=server)
+        self._phase = self._PHASE_ENTERING_SERVER
+        server = self.target_server
+        if server.current_request is None:
+            server.accept_request(self)
+        elif server.current_request and server.current_request is not self:
+            self._drop(blocking_obj=server)
 
     def _check_on_enter_server(self):
-        """Check if request center has reached server center and begin processing animation if so."""
-        request_center_x = self.pos().x() + self._rect.width() / 2
-        server_center_x = self.target_server.scenePos().x() + self.target_server._rect.width() / 2
-
-        if request_center_x >= server_center_x:
-            self._has_entered_center = True
-            self._start_processing()
+        """Begin processing animation once request center has reached server center."""
+        self._phase = self._PHASE_DONE
+        self._start_processing()
 
     def _start_processing(self):
-        """Create a processing animation with clock-wise disappearing effect."""
-        self.processing_anim = QPropertyAnimation(self, b"remaining_angle")
-        self.processing_anim.setStartValue(360)
-        self.processing_anim.setEndValue(0)
-        self.processing_anim.setDuration(1000)
-        self.processing_anim.setEasingCurve(QEasingCurve.Linear)
-
-        self.processing_anim.finished.connect(self._on_processing_finished)
-        QTimer.singleShot(100, self.processing_anim.start)
+        """Start the processing animation with clock-wise disappearing effect."""
+        self.setCacheMode(QGraphicsItem.NoCache)
+        QTimer.singleShot(100, self._processing_anim.start)
 
     def _on_processing_finished(self):
-        """Clean up after drop animation completes."""
-        self.processing_anim.deleteLater()
+        """Clean up after processing animation completes."""
         scene = self.scene()
         if scene:
             scene.removeItem(self)
@@ -251,6 +376,8 @@ class Request(QGraphicsObject):
         if self.target_server:
             self.target_server.release_and_notify()
 
+        self._release()
+
     def _drop(self, blocking_obj):
         """
         Create a drop animation with bouncing back and falling off screen.
@@ -260,8 +387,11 @@ class Request(QGraphicsObject):
         """
         self.dropped.emit()
 
+        self._phase = self._PHASE_DONE
+        self._pending_checks = []
+        self._check_timer.stop()
+
         self._move_anim.stop()
-        self._move_anim.deleteLater()
 
         # Due to timing in animations, the request might not stop exactly at the
         # collision position, so it's manually set using the blocking object's position.
@@ -272,39 +402,30 @@ class Request(QGraphicsObject):
         end_x = stop_pos_x - self._rect.width() * 1.5
         end_y = self.scene().height() + 50
 
-        # Bounce back (horizontal movement)
-        self.bounce_anim = QPropertyAnimation(self, b"x")
-        self.bounce_anim.setStartValue(self.pos().x())
-        self.bounce_anim.setEndValue(end_x)
-        self.bounce_anim.setDuration(500)
-        self.bounce_anim.setEasingCurve(QEasingCurve.OutCubic)
-
-        # Drop down (vertical fall)
-        self.drop_anim = QPropertyAnimation(self, b"y")
-        self.drop_anim.setStartValue(self.pos().y())
-        self.drop_anim.setEndValue(end_y)
-        self.drop_anim.setDuration(500)
-        self.drop_anim.setEasingCurve(QEasingCurve.InQuad)
+        self._bounce_anim.setStartValue(self.pos().x())
+        self._bounce_anim.setEndValue(end_x)
+        self._drop_anim.setStartValue(self.pos().y())
+        self._drop_anim.setEndValue(end_y)
 
-        self.drop_anim.finished.connect(self._on_drop_finished)
-        self.bounce_anim.start()
-        self.drop_anim.start()
+        self._bounce_anim.start()
+        self._drop_anim.start()
 
     def _on_drop_finished(self):
         """Clean up after drop animation completes."""
-        self.bounce_anim.deleteLater()
-        self.drop_anim.deleteLater()
-
         scene = self.scene()
         if scene:
             scene.removeItem(self)
 
+        self._release()
+
     def _get_remaining_angle(self):
         """Get the remaining angle for animation."""
         return self._remaining_angle
 
     def _set_remaining_angle(self, angle):
-        """Set the remaining angle and trigger repaint."""
+        """Set the remaining angle and trigger repaint if it changed."""
+        if angle == self._remaining_angle:
+            return
         self._remaining_angle = angle
         self.update()
 
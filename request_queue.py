@@ -1,9 +1,11 @@
-import bisect
+from collections import deque
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Qt, QRectF
 from PySide6.QtGui import QBrush, QColor
-from PySide6.QtWidgets import QGraphicsObject
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsObject
+
+from sim_scene import SimScene
 
 
 if TYPE_CHECKING:
@@ -11,7 +13,10 @@ if TYPE_CHECKING:
     from request import Request
 
 class RequestQueue(QGraphicsObject):
-    def __init__(self, x, y, capacity, server: 'Server | None' = None, parent=None):
+    # Lets SimScene track the queue in its queues list
+    kind = SimScene.KIND_QUEUE
+
+    def __init__(self, x: float, y: float, capacity: int, server: 'Server | None' = None, parent=None):
         """
         Constructs a Queue with an optional parent item.
 
@@ -25,7 +30,11 @@ class RequestQueue(QGraphicsObject):
         super().__init__(parent)
 
         # Queue state
-        self.queue = []
+        # One FIFO bucket per priority level (1=high, 2=normal), highest priority first.
+        # A request's bucket is picked from its priority when it's accepted, so the
+        # priority must not change while the request is queued.
+        self._buckets = {1: deque(), 2: deque()}
+        self._size = 0  # Number of requests in the queue, read by clients routing requests
         self.can_bypass = True
         self.capacity = capacity
         self.paired_server = server
@@ -35,9 +44,23 @@ class RequestQueue(QGraphicsObject):
         self._rect = QRectF(0, 0, width, 100)
         self._color = QColor(230, 230, 230)
 
+        # Scene positions of requests in each slot, from the front of the queue to
+        # the back, and of rejected requests stopped in front of the queue
+        request_size = 80
+        slot_width = request_size + 10
+        self._slot_xs = [
+            x + slot_width * (self.capacity - position) + 10
+            for position in range(1, self.capacity + 1)
+        ]
+        self._reject_x = x - request_size + 1
+        self._slot_y = y + (self._rect.height() - request_size) / 2
+
         self.setPos(x, y)
         self.setAcceptedMouseButtons(Qt.NoButton)
 
+        # The shape never changes, so paint it once and reuse the cached image
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
     def boundingRect(self):
         """
         Defines the smallest rect enclosing the item; used for painting,
@@ -65,7 +88,22 @@ class RequestQueue(QGraphicsObject):
         painter.setBrush(QBrush(self._color))
         painter.drawRoundedRect(self._rect, 50, 50)
 
-    def accept_request(self, request: 'Request'):
+    def slot_scene_pos(self, position: int) -> 'tuple[float, float]':
+        """
+        Get the scene position for a request at the given queue position.
+
+        Args:
+            position: The position (index + 1) returned by accept_request
+
+        Returns:
+            A tuple (x, y). Positions beyond capacity map to the spot in front
+            of the queue where rejected requests stop.
+        """
+        if position <= self.capacity:
+            return self._slot_xs[position - 1], self._slot_y
+        return self._reject_x, self._slot_y
+
+    def accept_request(self, request: 'Request') -> int:
         """
         Add request to the priority queue.
         Requests are ordered by priority first (1 before 2), then by arrival order (FIFO).
@@ -76,37 +114,40 @@ class RequestQueue(QGraphicsObject):
         Returns:
             The position (index + 1) of the added request in the queue.
         """
-        queue = self.queue
-
-        if len(queue) < self.capacity:
-            entry = (request.priority, request)
+        if self._size >= self.capacity:
+            return self.capacity + 1
 
-            # Insert in sorted position
-            index = bisect.bisect_right(queue, entry)
-            queue.insert(index, entry)
+        self._buckets[request.priority].append(request)
+        self._size += 1
 
-            # Move backward all requests that are now behind the new one
-            for i in range(index + 1, len(queue)):
-                request = queue[i][1]
-                request.move_backward()
+        # Count the requests ahead of the new one, and move backward all
+        # lower-priority requests that are now behind it
+        position = 0
+        for priority, bucket in self._buckets.items():
+            if priority <= request.priority:
+                position += len(bucket)
+            else:
+                for queued_request in bucket:
+                    queued_request.move_backward()
 
-            return index + 1
-        else:
-            return self.capacity + 1
+        return position
 
-    def send_request(self):
+    def send_request(self) -> None:
         """Send the highest priority request to the server."""
-        queue = self.queue
-
-        if not queue:
+        if not self._size:
             # Set to True if requests can bypass the queue and go directly to server.
             self.can_bypass = True
+            scene = self.scene()
+            if scene:
+                scene.bypass_queues.add(self)
             return
 
         # Pop the first request (highest priority) and send to server
-        request = queue.pop(0)[1]
+        request = next(bucket for bucket in self._buckets.values() if bucket).popleft()
+        self._size -= 1
         request.move_to_server(self.paired_server)
 
         # Move all remaining requests forward one slot
-        for _, request in queue:
-            request.move_forward()
+        for bucket in self._buckets.values():
+            for queued_request in bucket:
+                queued_request.move_forward()
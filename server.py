@@ -1,15 +1,22 @@
+import weakref
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Qt, QRectF
 from PySide6.QtGui import QBrush, QColor
-from PySide6.QtWidgets import QGraphicsObject
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsObject
+
+from sim_scene import SimScene
 
 
 if TYPE_CHECKING:
     from request_queue import RequestQueue
+    from request import Request
 
 class Server(QGraphicsObject):
-    def __init__(self, x, y, queue: 'RequestQueue | None' = None, parent=None):
+    # Lets SimScene track the server in its servers list
+    kind = SimScene.KIND_SERVER
+
+    def __init__(self, x: float, y: float, queue: 'RequestQueue | None' = None, parent=None):
         """
         Constructs a Client with an optional parent item.
 
@@ -31,6 +38,22 @@ class Server(QGraphicsObject):
 
         self.setPos(x, y)
 
+        # The shape never changes, so paint it once and reuse the cached image
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+    @property
+    def paired_queue(self) -> 'RequestQueue | None':
+        """The RequestQueue feeding this server, or None."""
+        if self._paired_queue_ref is None:
+            return None
+        return self._paired_queue_ref()
+
+    @paired_queue.setter
+    def paired_queue(self, queue: 'RequestQueue | None') -> None:
+        # Held weakly, since the queue already holds this server as its paired_server
+        # and a strong reference back would form a cycle for the garbage collector
+        self._paired_queue_ref = weakref.ref(queue) if queue is not None else None
+
     def boundingRect(self):
         """
         Defines the smallest rect enclosing the item; used for painting,
@@ -58,12 +81,12 @@ class Server(QGraphicsObject):
         painter.setBrush(QBrush(self._color))
         painter.drawRoundedRect(self._rect, 25, 25)
 
-    def accept_request(self, request):
+    def accept_request(self, request: 'Request') -> None:
         """Accept request and mark server as busy."""
         if request:
             self.current_request = request
 
-    def release_and_notify(self):
+    def release_and_notify(self) -> None:
         """Release request, mark server as free, and notify queue to send next."""
         self.current_request = None
         if self.paired_queue:
@@ -0,0 +1,69 @@
+from PySide6.QtWidgets import QGraphicsScene
+
+
+class SimScene(QGraphicsScene):
+    """
+    The graphics scene for the simulation.
+
+    Keeps registries of the queues and servers currently in the scene, so
+    requests can be routed without scanning every scene item.
+    """
+
+    # Values of the `kind` class attribute on items that are registered
+    KIND_QUEUE = 1
+    KIND_SERVER = 2
+
+    def __init__(self, x, y, width, height, parent=None):
+        """
+        Constructs a SimScene with the given scene rect.
+
+        Args:
+            x: Scene rect position x
+            y: Scene rect position y
+            width: Scene rect width
+            height: Scene rect height
+            parent: QObject
+        """
+        super().__init__(x, y, width, height, parent)
+
+        # Items currently in the scene, by kind
+        self.queues = []
+        self.servers = []
+        self._registries = {
+            self.KIND_QUEUE: self.queues,
+            self.KIND_SERVER: self.servers,
+        }
+
+        # Queues in the scene whose server is free and queue is empty, so requests
+        # can skip the queue. Updated wherever RequestQueue.can_bypass flips.
+        self.bypass_queues = set()
+
+    def addItem(self, item):
+        """
+        Add an item to the scene and register it by kind.
+
+        Args:
+            item: QGraphicsItem
+        """
+        super().addItem(item)
+
+        kind = getattr(item, 'kind', None)
+        registry = self._registries.get(kind)
+        if registry is not None:
+            registry.append(item)
+            if kind == self.KIND_QUEUE and item.can_bypass:
+                self.bypass_queues.add(item)
+
+    def removeItem(self, item):
+        """
+        Remove an item from the scene and unregister it.
+
+        Args:
+            item: QGraphicsItem
+        """
+        super().removeItem(item)
+
+        registry = self._registries.get(getattr(item, 'kind', None))
+        if registry is not None:
+            registry.remove(item)
+            self.bypass_queues.discard(item)
@@ -3,6 +3,19 @@ from PySide6.QtWidgets import QGraphicsView, QGraphicsScene
 from client import Client
 from server import Server
 from request_queue import RequestQueue
+from sim_scene import SimScene
+
+# Vertical positions of the three rows
+_TOP_ROW_Y = 0
+_CENTER_ROW_Y = 150
+_BOTTOM_ROW_Y = 300
+
+# Geometry shared by every server/queue row: the queue sits centered between
+# the clients (100 wide at x=0) and the server.
+_SERVER_X = 800
+_QUEUE_CAPACITY = 5
+_QUEUE_WIDTH = (80 + 10) * _QUEUE_CAPACITY + 10
+_QUEUE_X = (100 + _SERVER_X - _QUEUE_WIDTH) / 2
 
 
 class View(QGraphicsView):
@@ -18,31 +31,43 @@ class View(QGraphicsView):
         # 0: no queue, 1: center, 2: center + top, 3: center + top + bottom
         self._queue_num = 0
 
+        # Steps that add or remove a queue, indexed by the queue number they
+        # move from (adding) or to (removing)
+        self._add_steps = (self._add_center_queue, self._add_top_row, self._add_bottom_row)
+        self._remove_steps = (self._remove_center_queue, self._remove_top_row, self._remove_bottom_row)
+
         self._setup_scene()
         self._create_items()
         self._add_initial_items()
 
     def _setup_scene(self):
         """Configure the graphics scene and view settings."""
-        scene = QGraphicsScene(0, 0, 900, 400)
+        scene = SimScene(0, 0, 900, 400)
+        # Items are never looked up by position (queues and servers are registered
+        # by the scene), and requests move constantly, so a BSP index would only
+        # add cost to every position update.
+        scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(scene)
         self.setFrameShape(QGraphicsView.NoFrame)
         self.setRenderHints(QPainter.Antialiasing)
 
-    def _create_items(self):
-        """Create all scene items (client, servers, queues)."""
-        top_row_y = 0
-        center_row_y = 150
-        bottom_row_y = 300
+        # Many small requests move at once, so repaint only the regions they touch.
+        # Every item sets its own pen and brush and paints inside its bounding rect,
+        # so Qt doesn't need to save painter state or pad exposed regions for them.
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
 
+    def _create_items(self):
+        """Create the clients and the center server and queue."""
         # Create client
-        self.client = Client(0, center_row_y)
-        self.priority_client = Client(0, top_row_y, priority=1)
+        self.client = Client(0, _CENTER_ROW_Y)
+        self.priority_client = Client(0, _TOP_ROW_Y, priority=1)
 
-        # Create servers and queues
-        self.server_center, self.queue_center = self._create_row(center_row_y)
-        self.server_top, self.queue_top = self._create_row(top_row_y)
-        self.server_bottom, self.queue_bottom = self._create_row(bottom_row_y)
+        # Create servers and queues; top and bottom rows are created on first use
+        self.server_center, self.queue_center = self._create_row(_CENTER_ROW_Y)
+        self.server_top = self.queue_top = None
+        self.server_bottom = self.queue_bottom = None
 
     def _add_initial_items(self):
         """Add initially visible items to the scene."""
@@ -52,57 +77,72 @@ class View(QGraphicsView):
 
     def _create_row(self, row_y):
         """Create and link a server and queue pair."""
-        server_x = 800
-        queue_capacity = 5
-        queue_width = (80 + 10) * queue_capacity + 10
-        queue_x = (100 + server_x - queue_width) / 2
-
-        server = Server(server_x, row_y)
-        queue = RequestQueue(queue_x, row_y, queue_capacity, server=server)
+        server = Server(_SERVER_X, row_y)
+        queue = RequestQueue(_QUEUE_X, row_y, _QUEUE_CAPACITY, server=server)
         server.paired_queue = queue
         return server, queue
 
-    def add_queue(self):
-        """Add the next queue in sequence: center -> top -> bottom."""
-        scene = self.scene()
+    def _ensure_top_row(self):
+        """Create the top server and queue if they don't exist yet."""
+        if self.server_top is None:
+            self.server_top, self.queue_top = self._create_row(_TOP_ROW_Y)
 
-        if self._queue_num == 0:
-            scene.addItem(self.queue_center)
-            self._queue_num = 1
+    def _ensure_bottom_row(self):
+        """Create the bottom server and queue if they don't exist yet."""
+        if self.server_bottom is None:
+            self.server_bottom, self.queue_bottom = self._create_row(_BOTTOM_ROW_Y)
 
-        elif self._queue_num == 1:
-            scene.addItem(self.server_top)
-            scene.addItem(self.queue_top)
-            self._queue_num = 2
-
-        elif self._queue_num == 2:
-            scene.addItem(self.server_bottom)
-            scene.addItem(self.queue_bottom)
-            self._queue_num = 3
+    def add_queue(self):
+        """Add the next queue in sequence: center -> top -> bottom."""
+        if self._queue_num < len(self._add_steps):
+            self._add_steps[self._queue_num]()
+            self._queue_num += 1
 
-        reach_max_queue_num = self._queue_num == 3
+        reach_max_queue_num = self._queue_num == len(self._add_steps)
         return reach_max_queue_num
 
     def remove_queue(self):
         """Remove queues in reverse order: bottom -> top -> center."""
+        if self._queue_num > 0:
+            self._queue_num -= 1
+            self._remove_steps[self._queue_num]()
+
+        reach_min_queue_num = self._queue_num == 0
+        return reach_min_queue_num
+
+    def _add_center_queue(self):
+        """Add the center queue; its server is always in the scene."""
+        self.scene().addItem(self.queue_center)
+
+    def _add_top_row(self):
+        """Add the top server and queue."""
+        self._ensure_top_row()
         scene = self.scene()
+        scene.addItem(self.server_top)
+        scene.addItem(self.queue_top)
 
-        if self._queue_num == 3:
-            scene.removeItem(self.queue_bottom)
-            scene.removeItem(self.server_bottom)
-            self._queue_num = 2
+    def _add_bottom_row(self):
+        """Add the bottom server and queue."""
+        self._ensure_bottom_row()
+        scene = self.scene()
+        scene.addItem(self.server_bottom)
+        scene.addItem(self.queue_bottom)
 
-        elif self._queue_num == 2:
-            scene.removeItem(self.queue_top)
-            scene.removeItem(self.server_top)
-            self._queue_num = 1
+    def _remove_center_queue(self):
+        """Remove the center queue, leaving its server in the scene."""
+        self.scene().removeItem(self.queue_center)
 
-        elif self._queue_num == 1:
-            scene.removeItem(self.queue_center)
-            self._queue_num = 0
+    def _remove_top_row(self):
+        """Remove the top server and queue."""
+        scene = self.scene()
+        scene.removeItem(self.queue_top)
+        scene.removeItem(self.server_top)
 
-        reach_min_queue_num = self._queue_num == 0
-        return reach_min_queue_num
+    def _remove_bottom_row(self):
+        """Remove the bottom server and queue."""
+        scene = self.scene()
+        scene.removeItem(self.queue_bottom)
+        scene.removeItem(self.server_bottom)
 
     def show_priority_client(self):
         """Add the priority client to the scene."""